@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import json
+import operator
 import datapackage
 from copy import deepcopy
 from collections import defaultdict
@@ -116,11 +117,17 @@ def _get_relations(package, schema, current_resource_name=None):
 
     # Prepare relations
     relations = {}
+    external_packages = {}
     for fk in schema.foreign_keys:
         resource_name = fk['reference'].get('resource')
         package_name = fk['reference'].get('package')
         resource = None
 
+        # Reference resources are resolved only once
+        # even when they are shared by many foreign keys
+        if resource_name in relations:
+            continue
+
         # Self-referenced resource
         if not resource_name:
             for item in package.resources:
@@ -137,17 +144,12 @@ def _get_relations(package, schema, current_resource_name=None):
             descriptor = package_name
             if not descriptor.startswith('http'):
                 descriptor = '/'.join([package.base_path, package_name])
-            package = datapackage.Package(descriptor)
-            resource = package.get_resource(resource_name)
+            if descriptor not in external_packages:
+                external_packages[descriptor] = datapackage.Package(descriptor)
+            resource = external_packages[descriptor].get_resource(resource_name)
 
         # Add to relations (can be None)
         relations[resource_name] = resource
-        if resource and resource.tabular:
-            try:
-                relations[resource_name] = resource.read(keyed=True)
-            # TODO: datapackage should raise `IntegrityError` here
-            except datapackage.exceptions.CastError as exception:
-                raise _ReferenceTableError('[%s] %s' % (resource_name, str(exception)))
 
     return relations
 
@@ -164,21 +166,39 @@ def _get_foreign_keys_values(schema, relations):
     # [reference] [foreign_keys tuple] = { (foreign_keys_values, ) : one_keyedrow, ... }
     foreign_keys = defaultdict(dict)
     if schema:
+
+        # create a set of foreign keys
+        # to optimize we prepare index of existing values
+        # this index should use reference + foreign_keys as key
+        # cause many foreign keys may use the same reference
         for fk in schema.foreign_keys:
-            # load relation data
             relation = fk['reference']['resource']
-
-            # create a set of foreign keys
-            # to optimize we prepare index of existing values
-            # this index should use reference + foreign_keys as key
-            # cause many foreign keys may use the same reference
             foreign_keys[relation][tuple(fk['reference']['fields'])] = {}
-            for row in (relations[relation] or []):
-                key = tuple([row[foreign_field] for foreign_field in fk['reference']['fields']])
-                # here we should chose to pick the first or nth row which match
-                # previous implementation picked the first, so be it
-                if key not in foreign_keys[relation][tuple(fk['reference']['fields'])]:
-                    foreign_keys[relation][tuple(fk['reference']['fields'])][key] = row
+
+        # stream every relation once filling all its indexes on the fly
+        # so the reference table is never materialized in memory as a whole
+        for relation, indexes in foreign_keys.items():
+            resource = relations[relation]
+            if resource is None or not resource.tabular:
+                continue
+            # itemgetter is built once per index so extracting a key
+            # is a single call per row instead of a lookup per field
+            getters = []
+            for foreign_fields, index in indexes.items():
+                getter = operator.itemgetter(*foreign_fields)
+                getters.append((getter, len(foreign_fields) == 1, index))
+            try:
+                for row in resource.iter(keyed=True):
+                    for getter, is_single, index in getters:
+                        key = (getter(row),) if is_single else getter(row)
+                        # here we should chose to pick the first or nth row which match
+                        # previous implementation picked the first, so be it
+                        if key not in index:
+                            index[key] = row
+            # TODO: datapackage should raise `IntegrityError` here
+            except datapackage.exceptions.CastError as exception:
+                raise _ReferenceTableError('[%s] %s' % (relation, str(exception)))
+
     return foreign_keys
 
 
@@ -55,15 +55,17 @@ class Inspector(object):
         start = datetime.datetime.now()
 
         # Prepare preset
+        # Compile presets once per inspection as compilation is not free
+        presets = self.__presets
         preset = self.__get_source_preset(source, preset)
         if preset == 'nested':
-            options['presets'] = self.__presets
+            options['presets'] = presets
             for s in source:
                 if s.get('preset') is None:
                     s['preset'] = self.__get_source_preset(s['source'])
 
         # Prepare tables
-        preset_func = self.__get_preset(preset)['func']
+        preset_func = self.__get_preset(presets, preset)['func']
         warnings, tables = preset_func(source, **options)
         if len(tables) > self.__table_limit:
             warnings.append(
@@ -108,9 +110,9 @@ class Inspector(object):
     def __presets(self):
         return registry.compile_presets()
 
-    def __get_preset(self, preset):
+    def __get_preset(self, presets, preset):
         try:
-            return self.__presets[preset]
+            return presets[preset]
         except KeyError:
             message = 'Preset "%s" is not registered' % preset
             raise exceptions.GoodtablesException(message)
@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 from ..registry import preset
 from .. import exceptions
 
@@ -16,7 +17,8 @@ def nested(source, presets):
     warnings = []
     tables = []
 
-    # Add warnings, tables
+    # Prepare items
+    items = []
     source = deepcopy(source)
     for item in source:
         preset = item.pop('preset', 'table')
@@ -29,11 +31,24 @@ def nested(source, presets):
         except KeyError:
             message = 'Preset "%s" is not registered' % preset
             raise exceptions.GoodtablesException(message)
-        item_warnings, item_tables = preset_func(**item)
-        if checks:
-            for item_table in item_tables:
-                item_table['checks'] = checks
-        warnings.extend(item_warnings)
-        tables.extend(item_tables)
+        items.append((preset_func, item, checks))
+
+    # Add warnings, tables
+    # Items are independent so they are resolved concurrently
+    if items:
+        tasks = []
+        pool = ThreadPool(processes=len(items))
+        try:
+            for preset_func, item, checks in items:
+                tasks.append(pool.apply_async(preset_func, kwds=item))
+            for (preset_func, item, checks), task in zip(items, tasks):
+                item_warnings, item_tables = task.get()
+                if checks:
+                    for item_table in item_tables:
+                        item_table['checks'] = checks
+                warnings.extend(item_warnings)
+                tables.extend(item_tables)
+        finally:
+            pool.terminate()
 
     return warnings, tables
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import io
 import os
+import copy
 import yaml
 import pytest
 import fnmatch
@@ -39,14 +40,27 @@ def log():
     return fixture
 
 
-def pytest_generate_tests(metafunc):
-    if 'scenario' in metafunc.fixturenames:
-        scenarios = {}
+_scenarios = None
+
+
+def _load_scenarios():
+    # Scenario files are walked and parsed only once per session
+    # as every test function using them triggers its own generation pass
+    global _scenarios
+    if _scenarios is None:
+        _scenarios = {}
         for root, dirnames, filenames in os.walk('tests/scenarios'):
             for filename in fnmatch.filter(filenames, '*.yml'):
                 filepath = os.path.join(root, filename)
-                scenarios.update(yaml.load(io.open(filepath, encoding='utf-8')) or {})
+                _scenarios.update(yaml.safe_load(io.open(filepath, encoding='utf-8')) or {})
+    return _scenarios
+
+
+def pytest_generate_tests(metafunc):
+    if 'scenario' in metafunc.fixturenames:
+        scenarios = _load_scenarios()
         params = []
         for name in sorted(scenarios):
-            params.append([name, scenarios[name]])
+            # Tests mutate their scenario so they get a copy of the cache
+            params.append([name, copy.deepcopy(scenarios[name])])
         metafunc.parametrize('name, scenario', params)
@@ -25,7 +25,7 @@ def test_scenarios_return_valid_reports(name, scenario, report_schema):
     jsonschema.validate(report, report_schema)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def report_schema():
     path = os.path.join(
         os.path.dirname(__file__),